@@ -1,3 +1,5 @@
+import re
+from functools import lru_cache
 from typing import List, Optional
 
 import sqlglot
@@ -44,6 +46,21 @@ def get_columns_used_from_sql(sql, dialect=None, retain_table_prefix=False):
     return list(column_names)
 
 
+# Any column reference must contain at least one letter, underscore or
+# identifier quote. SQL without one of these (e.g. `1=1`) has no columns.
+_COLUMN_HINT_RE = re.compile(r'[^\W\d]|["`]')
+
+
+@lru_cache(maxsize=256)
+def _parse_cached(sql: str, sql_dialect: str) -> sqlglot.Expression:
+    """Parse a SQL string, reusing the syntax tree for any SQL that has
+    already been seen.
+
+    The returned tree is shared between callers and must not be mutated.
+    """
+    return sqlglot.parse_one(sql, read=sql_dialect)
+
+
 def parse_columns_in_sql(
     sql: str, sql_dialect: str, remove_quotes=True
 ) -> Optional[List[sqlglot.Expression]]:
@@ -55,10 +72,15 @@ def parse_columns_in_sql(
     Returns:
         list[exp.Column]: A list of columns as SQLglot expressions. These can be
             unwrapped with `.sql()`. If the input string is unparseable, None will
-            be returned.
+            be returned. Parsed trees are cached, so if `remove_quotes` is False
+            the returned columns should not be modified in place.
     """
+    # Skip parsing entirely where the SQL cannot contain a column
+    if not _COLUMN_HINT_RE.search(sql):
+        return []
+
     try:
-        syntax_tree = sqlglot.parse_one(sql, read=sql_dialect)
+        syntax_tree = _parse_cached(sql, sql_dialect)
     except Exception:  # Consider catching a more specific exception if possible
         # If we can't parse a SQL condition, it's better to just pass.
         return None
@@ -27,6 +27,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# The only table prefixes permitted in a blocking rule
+VALID_TABLE_NAMES = frozenset(("l", "r"))
+
 
 def validate_table_names(
     columns_to_check: list[sqlglot.expressions],
@@ -35,9 +38,11 @@ def validate_table_names(
     SQL statements. We expect all columns to be assigned either a `l` or
     `r` prefix.
     """
-    # list of valid columns
-    invalid_columns = [c.sql() for c in columns_to_check if c.table not in ["l", "r"]]
-    return InvalidTableNamesLogGenerator(set(invalid_columns))
+    # Only the invalid columns need to be rendered as SQL
+    invalid_columns = {
+        c.sql() for c in columns_to_check if c.table not in VALID_TABLE_NAMES
+    }
+    return InvalidTableNamesLogGenerator(invalid_columns)
 
 
 def validate_column_suffixes(
@@ -46,11 +51,13 @@ def validate_column_suffixes(
     """Validate a series of column suffixes. We expect columns to be suffixed
     with either `_l` or `_r`. Where this is missing, flag it as an error.
     """
-    # list of valid columns
-    invalid_columns = [
-        c.sql() for c in columns_to_check if not c.sql().endswith(("_l", "_r"))
-    ]
-    return InvalidColumnSuffixesLogGenerator(set(invalid_columns))
+    # The suffix is part of the column's name, not its rendered SQL (which
+    # may add a table prefix or dialect-specific quotes), so check the name
+    # and only render the invalid columns as SQL
+    invalid_columns = {
+        c.sql() for c in columns_to_check if not c.name.endswith(("_l", "_r"))
+    }
+    return InvalidColumnSuffixesLogGenerator(invalid_columns)
 
 
 def check_for_missing_settings_column(
@@ -92,8 +99,18 @@ def check_for_missing_or_invalid_columns_in_sql_strings(
             `validate_table_names`, and `validate_column_suffixes`.
     """
 
+    # Convert our input columns to a set once, rather than for every column
+    # we check in the loop below. This is a no-op if we already have a frozenset.
+    valid_input_dataframe_columns = frozenset(valid_input_dataframe_columns)
+
     validation_dict = {}
+    validated_sql_strings = set()
     for sql_string in sql_strings:
+        # Identical SQL strings produce identical results, so only check each once
+        if sql_string in validated_sql_strings:
+            continue
+        validated_sql_strings.add(sql_string)
+
         # `parse_columns_in_sql` also checks if our sql string is parseable
         identified_columns_in_sql = parse_columns_in_sql(
             sql_string, sql_dialect=sql_dialect
@@ -112,7 +129,6 @@ def check_for_missing_or_invalid_columns_in_sql_strings(
         missing_columns = clean_and_find_columns_not_in_input_dfs(
             valid_input_dataframe_columns=valid_input_dataframe_columns,
             sqlglot_tree_columns_to_check=identified_columns_in_sql,
-            sql_dialect=sql_dialect,
         )
         if missing_columns:
             missing_columns = MissingColumnsLogGenerator(missing_columns)
@@ -147,6 +163,8 @@ def check_comparison_for_missing_or_invalid_sql_strings(
 
     If any errors are identified, log them in the invalid_column_tracker.
     """
+    valid_input_dataframe_columns = frozenset(valid_input_dataframe_columns)
+
     invalid_column_tracker = []
     for comparison in comparisons_to_check:
         comp_dict = comparison.as_dict()
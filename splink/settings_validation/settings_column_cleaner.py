@@ -1,15 +1,13 @@
 from __future__ import annotations
 
 import logging
-import re
-from copy import deepcopy
-from functools import reduce
-from operator import and_
+from dataclasses import replace
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING, List
 
 import sqlglot
 
-from ..input_column import InputColumn
+from ..input_column import InputColumn, SqlglotColumnTreeBuilder
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +16,7 @@ if TYPE_CHECKING:
 
 
 def remove_suffix(c):
-    return re.sub("_[l|r]{1}$", "", c)
+    return c[:-2] if c.endswith(("_l", "_r")) else c
 
 
 def find_columns_not_in_input_dfs(
@@ -31,41 +29,56 @@ def find_columns_not_in_input_dfs(
     if type(columns_to_check) == str:
         columns_to_check = [columns_to_check]
 
-    return {col for col in columns_to_check if col not in valid_input_dataframe_columns}
+    # A single set difference, rather than a membership check per column
+    return set(columns_to_check).difference(valid_input_dataframe_columns)
 
 
 def clean_and_find_columns_not_in_input_dfs(
     valid_input_dataframe_columns: list,
     sqlglot_tree_columns_to_check: list[sqlglot.expressions],
-    sql_dialect: str,
 ) -> set[str]:
     """Clean a list of sqlglot column names to remove the prefix (l.)
     and suffix (_l) and then return any that are missing from the
     input dataframe(s).
     """
-    sqlglot_tree_columns_to_check = deepcopy(sqlglot_tree_columns_to_check)
-    cleaned_cols = set(
-        remove_prefix_and_suffix_from_column(c, sql_dialect=sql_dialect)
-        for c in sqlglot_tree_columns_to_check
-    )
+    cleaned_cols = {
+        remove_prefix_and_suffix_from_column(c) for c in sqlglot_tree_columns_to_check
+    }
     return find_columns_not_in_input_dfs(valid_input_dataframe_columns, cleaned_cols)
 
 
-def remove_prefix_and_suffix_from_column(
-    col_syntax_tree: sqlglot.expressions,
-    sql_dialect: str,
-):
-    """Remove the prefix and suffix from a given sqlglot syntax tree
-    and return it as a string of SQL.
+def remove_prefix_and_suffix_from_column(col_syntax_tree: sqlglot.expressions):
+    """Remove the prefix and suffix from a given sqlglot column and
+    return its name.
+
+    A column's `name` already excludes any table prefix, so no SQL needs
+    to be generated and the syntax tree is left untouched. This means the
+    same columns can safely be passed on to any further validation checks.
 
     Args:
-        col_syntax_tree (sqlglot.expressions): _description_
+        col_syntax_tree (sqlglot.expressions): A sqlglot column expression.
 
     Returns:
         str: A column without `l.` and/or `_l`
     """
-    col_syntax_tree.args["table"] = None
-    return remove_suffix(col_syntax_tree.sql(sql_dialect))
+    col_name = col_syntax_tree.name
+    # Keep any qualifiers other than the table (e.g. `db` in `db.l.col`),
+    # so that these references are still reported as missing columns
+    if col_syntax_tree.args.get("db") or col_syntax_tree.args.get("catalog"):
+        qualifiers = (col_syntax_tree.text("catalog"), col_syntax_tree.text("db"))
+        col_name = ".".join([q for q in qualifiers if q] + [col_name])
+    return remove_suffix(col_name)
+
+
+@lru_cache(maxsize=4096)
+def _unquoted_column_name(col_builder: SqlglotColumnTreeBuilder) -> str:
+    """Generate the unquoted name for a column.
+
+    `SqlglotColumnTreeBuilder` is a frozen dataclass, so it can be used directly
+    as the cache key. This means the sqlglot tree is only built and rendered once
+    for each distinct column, however many times that column is cleaned.
+    """
+    return replace(col_builder, quoted=False).sql
 
 
 def clean_list_of_column_names(col_list: List[InputColumn]):
@@ -76,9 +89,9 @@ def clean_list_of_column_names(col_list: List[InputColumn]):
         col_list (list): A list of InputColumn classes.
     """
     if col_list is None:
-        return ()  # needs to be a blank iterable
+        return frozenset()  # needs to be a blank iterable
 
-    return set((c.unquote().name for c in col_list))
+    return frozenset(_unquoted_column_name(c.col_builder) for c in col_list)
 
 
 def clean_user_input_columns(input_columns: dict, return_as_single_column: bool = True):
@@ -86,14 +99,21 @@ def clean_user_input_columns(input_columns: dict, return_as_single_column: bool
     within.
 
     Returns:
-        dict: A dictionary of the format `{"table_name": [col1, col2, ...]}
+        frozenset | dict: If `return_as_single_column` is True, a frozenset of
+            the columns found in every input dataframe. Otherwise, a dictionary
+            of the format `{"table_name": frozenset({col1, col2, ...})}`
     """
     # For each input dataframe, grab the column names and create a dictionary
     # of the form: {table_name: [column_1, column_2, ...]}
     input_columns = {k: clean_list_of_column_names(v.columns) for k, v in input_columns}
 
     if return_as_single_column:
-        return reduce(and_, input_columns.values())
+        # Intersect all tables in a single call, rather than creating an
+        # intermediate set for each additional table
+        column_sets = list(input_columns.values())
+        if not column_sets:
+            return frozenset()
+        return column_sets[0].intersection(*column_sets[1:])
     else:
         return input_columns
 
@@ -107,20 +127,21 @@ class SettingsColumnCleaner:
     def __init__(self, settings_object: Settings, input_columns: dict):
         self.sql_dialect = settings_object._sql_dialect
         self._settings_obj = settings_object
-        self.input_columns = clean_user_input_columns(
+        # Built up front, so no column cleaning happens while validating
+        self.input_columns: frozenset = clean_user_input_columns(
             input_columns.items(), return_as_single_column=True
         )
 
-    @property
+    @cached_property
     def cols_to_retain(self):
         return clean_list_of_column_names(self._settings_obj._additional_cols_to_retain)
 
-    @property
+    @cached_property
     def uid(self):
         uid_as_tree = InputColumn(self._settings_obj._unique_id_column_name)
         return clean_list_of_column_names([uid_as_tree])
 
-    @property
+    @cached_property
     def blocking_rules(self):
         brs = self._settings_obj._blocking_rules_to_generate_predictions
         return [br.blocking_rule_sql for br in brs]
@@ -1,5 +1,6 @@
+from dataclasses import dataclass, field
 from functools import partial
-from typing import List, NamedTuple, Tuple
+from typing import List, Tuple
 
 
 def indent_error_message(message):
@@ -7,48 +8,50 @@ def indent_error_message(message):
     return "\n    ".join(message.splitlines())
 
 
-class InvalidColumnsLogGenerator(NamedTuple):
+@dataclass(frozen=True)
+class InvalidColumnsLogGenerator:
     """
-    A simple NamedTuple to aid in the construction of
+    A simple frozen dataclass to aid in the construction of
     our log strings.
 
     It takes two arguments:
         invalid_type (str): The type of invalid column
-            detected. This can be one of: `invalid_cols`,
-            `invalid_table_pref` or `invalid_col_suffix`.
+            detected. This can be one of: `missing_columns`,
+            `invalid_table_name` or `invalid_column_suffix`.
         invalid_columns (list): A list of the invalid
             columns that have been detected.
+
+    The text used in the log string is built once, when the
+    class is initialised.
     """
 
     invalid_type: str
     invalid_columns: set
-
-    @property
-    def log_string_prefix(self):
-        return "       - "
-
-    @property
-    def columns_as_text(self):
-        """Returns the invalid columns as a comma-separated
-        string wrapped with backticks."""
-
-        return ", ".join(f"`{c}`" for c in self.invalid_columns)
-
-    @property
-    def missing_columns(self):
-        return "Missing column(s) from input dataframe(s): "
-
-    @property
-    def invalid_table_name(self):
-        return "Invalid table names provided (only `l.` and `r.` are valid): "
-
-    @property
-    def invalid_column_suffix(self):
-        return "Invalid table suffixes provided (only `_l` and `_r` are valid): "
+    # The invalid columns as a comma-separated string wrapped with backticks
+    columns_as_text: str = field(init=False, repr=False, compare=False)
+
+    log_string_prefix = "       - "
+    # The message used for each `invalid_type`
+    invalid_type_messages = {
+        "missing_columns": "Missing column(s) from input dataframe(s): ",
+        "invalid_table_name": (
+            "Invalid table names provided (only `l.` and `r.` are valid): "
+        ),
+        "invalid_column_suffix": (
+            "Invalid table suffixes provided (only `_l` and `_r` are valid): "
+        ),
+    }
+
+    def __post_init__(self):
+        columns_as_text = ", ".join(f"`{c}`" for c in self.invalid_columns)
+        object.__setattr__(self, "columns_as_text", columns_as_text)
 
     def construct_log_string(self):
-        # calls invalid_cols, invalid_table_pref, etc
-        invalid_string = getattr(self, self.invalid_type)
+        # Nothing to log if no invalid columns were found
+        if not self.invalid_columns:
+            return ""
+
+        invalid_string = self.invalid_type_messages[self.invalid_type]
         return self.log_string_prefix + invalid_string + self.columns_as_text
 
 
@@ -10,6 +10,7 @@ from splink.duckdb.blocking_rule_library import block_on
 from splink.duckdb.comparison_library import levenshtein_at_thresholds
 from splink.duckdb.linker import DuckDBLinker
 from splink.exceptions import ErrorLogger
+from splink.parse_sql import _parse_cached, parse_columns_in_sql
 from splink.settings_validation.log_invalid_columns import (
     InvalidColumnSuffixesLogGenerator,
     InvalidTableNamesLogGenerator,
@@ -19,6 +20,10 @@ from splink.settings_validation.log_invalid_columns import (
     check_for_missing_settings_column,
     validate_table_names,
 )
+from splink.settings_validation.settings_column_cleaner import (
+    SettingsColumnCleaner,
+    clean_and_find_columns_not_in_input_dfs,
+)
 from splink.settings_validation.valid_types import (
     log_comparison_errors,
     validate_comparison_levels,
@@ -59,6 +64,7 @@ missing_settings_column_test_cases = [
 blocking_rule_test_cases = {
     "l.surname = r.surname": [],
     "": [],  # handles it gracefully
+    "1=1": [],  # contains no columns, so is never parsed
     "l.first_name = r.first_name and l.dob = r.dob": [],
     "levenshtein(l.email, r.email) <= 2": [],
     "l.invalid_col = r.invalid_col": [MissingColumnsLogGenerator({"invalid_col"})],
@@ -84,6 +90,12 @@ blocking_rule_test_cases = {
     'dmetaphone(c."surname", r."surname")': [
         InvalidTableNamesLogGenerator({"c.surname"})
     ],
+    # Qualifiers other than the table name are kept in the missing column
+    "db.l.first_name = r.first_name": [MissingColumnsLogGenerator({"db.first_name"})],
+    "l.struct_col.field = r.first_name": [
+        MissingColumnsLogGenerator({"l.field"}),
+        InvalidTableNamesLogGenerator({"l.struct_col.field"}),
+    ],
     block_on(["left", "right"]).blocking_rule_sql: [
         MissingColumnsLogGenerator({"left", "right"})
     ],
@@ -213,6 +225,39 @@ def test_identical_blocking_rules_ignored():
     assert len(result) == 1
 
 
+def test_cleaning_columns_does_not_modify_syntax_tree():
+    columns = parse_columns_in_sql("l.first_name = z.surname_r", sql_dialect="duckdb")
+    missing_columns = clean_and_find_columns_not_in_input_dfs(
+        valid_input_dataframe_columns=VALID_INPUT_COLUMNS,
+        sqlglot_tree_columns_to_check=columns,
+    )
+
+    assert missing_columns == set()
+    # Table names must survive for any subsequent validation checks
+    assert [c.table for c in columns] == ["l", "z"]
+
+
+def test_sql_without_columns_is_not_parsed():
+    misses = _parse_cached.cache_info().misses
+    assert parse_columns_in_sql("1=1", sql_dialect="duckdb") == []
+    assert _parse_cached.cache_info().misses == misses
+
+    # SQL that may contain columns is still parsed
+    parse_columns_in_sql("l.unparsed_col = 1", sql_dialect="duckdb")
+    assert _parse_cached.cache_info().misses == misses + 1
+
+
+def test_settings_column_cleaner_input_columns():
+    linker = DuckDBLinker(DF, get_settings_dict())
+    cleaned_settings = SettingsColumnCleaner(
+        settings_object=linker._settings_obj,
+        input_columns=linker._input_tables_dict,
+    )
+
+    assert cleaned_settings.input_columns == frozenset(VALID_INPUT_COLUMNS)
+    assert isinstance(cleaned_settings.input_columns, frozenset)
+
+
 def test_check_for_missing_or_invalid_columns_in_sql_strings():
     invalid_comparisons_identified = (
         check_comparison_for_missing_or_invalid_sql_strings(
@@ -278,6 +323,24 @@ def test_settings_validation_logs(caplog):
             assert header in caplog.text and error in caplog.text
 
 
+def test_settings_validation_logs_with_no_shared_input_columns(caplog):
+    # Where the input tables share no columns, every settings column
+    # should still be reported as missing
+    df_1 = pd.DataFrame({"unique_id": [1, 2], "first_name": ["a", "b"]})
+    df_2 = pd.DataFrame({"id": [1, 2], "surname": ["a", "b"]})
+    settings = {
+        "link_type": "link_only",
+        "blocking_rules_to_generate_predictions": ["l.first_name = r.first_name"],
+    }
+
+    with caplog.at_level(logging.WARNING):
+        DuckDBLinker([df_1, df_2], settings, validate_settings=True)
+
+    assert "Setting: `unique_id_column_name`" in caplog.text
+    assert "Missing column(s) from input dataframe(s): `unique_id`" in caplog.text
+    assert "Missing column(s) from input dataframe(s): `first_name`" in caplog.text
+
+
 def test_settings_validation_on_2_to_3_converter():
     df = pd.read_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
 